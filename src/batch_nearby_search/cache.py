@@ -11,6 +11,8 @@ import os
 from cachetools import LRUCache, TTLCache
 from typing import Any
 
+from .utils import canonicalize_address
+
 # Cache configuration
 GEOCODING_CACHE_SIZE = int(os.getenv("GEOCODING_CACHE_SIZE", "1000"))
 PLACES_CACHE_SIZE = int(os.getenv("PLACES_CACHE_SIZE", "500"))
@@ -50,7 +52,7 @@ def get_geocoding_cache(address: str) -> dict | None:
     Returns:
         Cached coordinates dict {lat, lng} or None if not cached
     """
-    key = make_cache_key("geocode", address.lower().strip())
+    key = make_cache_key("geocode", canonicalize_address(address))
     result = geocoding_cache.get(key)
     if result:
         cache_stats["geocoding_hits"] += 1
@@ -67,37 +69,92 @@ def set_geocoding_cache(address: str, coordinates: dict) -> None:
         address: The address that was geocoded
         coordinates: Dict with {lat, lng}
     """
-    key = make_cache_key("geocode", address.lower().strip())
+    key = make_cache_key("geocode", canonicalize_address(address))
     geocoding_cache[key] = coordinates
 
 
-def get_places_cache(lat: float, lng: float, feature_type: str, radius: int) -> list | None:
+def _places_cache_key(
+    lat: float, lng: float, feature_type: str, radius: int, max_results: int, field_mask: str
+) -> str:
+    """
+    Create the places cache key, snapping coordinates to a grid sized to the radius.
+
+    Cells are roughly 1/10 of the search radius, so nearby origins (e.g. the same
+    address geocoded slightly differently) share cached results.
+
+    Args:
+        lat: Latitude
+        lng: Longitude
+        feature_type: Place type (e.g., "park")
+        radius: Search radius in meters
+        max_results: Result count the places were requested with
+        field_mask: Places API field mask the results were fetched with
+
+    Returns:
+        Cache key for the grid cell
+    """
+    if radius >= 10000:
+        precision = 2  # ~1.1 km cells
+    elif radius >= 1000:
+        precision = 3  # ~110 meter cells
+    else:
+        precision = 4  # ~11 meter cells
+
+    return make_cache_key(
+        "places",
+        round(lat, precision),
+        round(lng, precision),
+        feature_type,
+        radius,
+        max_results,
+        field_mask,
+    )
+
+
+def get_places_cache(
+    lat: float, lng: float, feature_type: str, radius: int, max_results: int, field_mask: str
+) -> dict | None:
     """
     Get nearby places result from cache.
 
+    An entry cached for a different origin in the same grid cell is only a hit if
+    it was complete (the API returned every place it had), since an incomplete
+    list is the other origin's nearest N and may miss places nearer this one.
+
     Args:
         lat: Latitude
         lng: Longitude
         feature_type: Place type (e.g., "park")
         radius: Search radius in meters
+        max_results: Result count the places were requested with
+        field_mask: Places API field mask the results were fetched with
 
     Returns:
-        Cached places list or None if not cached
+        Cached entry dict {lat, lng, complete, places} or None if not usable
     """
-    # Round coordinates to reduce cache misses from tiny differences
-    lat_rounded = round(lat, 4)  # ~11 meters precision
-    lng_rounded = round(lng, 4)
-    key = make_cache_key("places", lat_rounded, lng_rounded, feature_type, radius)
+    key = _places_cache_key(lat, lng, feature_type, radius, max_results, field_mask)
 
-    result = places_cache.get(key)
-    if result:
+    entry = places_cache.get(key)
+    if entry is not None and not (entry["complete"] or (entry["lat"], entry["lng"]) == (lat, lng)):
+        entry = None
+
+    if entry is not None:
         cache_stats["places_hits"] += 1
     else:
         cache_stats["places_misses"] += 1
-    return result
-
-
-def set_places_cache(lat: float, lng: float, feature_type: str, radius: int, places: list) -> None:
+    return entry
+
+
+def set_places_cache(
+    lat: float,
+    lng: float,
+    feature_type: str,
+    radius: int,
+    max_results: int,
+    field_mask: str,
+    places: list,
+    complete: bool,
+) -> None:
     """
     Store nearby places result in cache.
 
@@ -106,18 +163,32 @@ def set_places_cache(lat: float, lng: float, feature_type: str, radius: int, pla
         lng: Longitude
         feature_type: Place type (e.g., "park")
         radius: Search radius in meters
+        max_results: Result count the places were requested with
+        field_mask: Places API field mask the results were fetched with
         places: List of place results to cache
+        complete: Whether the API returned fewer places than requested, i.e. all it had
     """
-    lat_rounded = round(lat, 4)
-    lng_rounded = round(lng, 4)
-    key = make_cache_key("places", lat_rounded, lng_rounded, feature_type, radius)
-    places_cache[key] = places
+    key = _places_cache_key(lat, lng, feature_type, radius, max_results, field_mask)
+    places_cache[key] = {"lat": lat, "lng": lng, "complete": complete, "places": places}
+
+
+# Offsets to the 8 reverse geocoding grid cells around a point (4 decimal places)
+_NEIGHBOUR_STEPS = [
+    (lat_step * 0.0001, lng_step * 0.0001)
+    for lat_step in (-1, 0, 1)
+    for lng_step in (-1, 0, 1)
+    if lat_step or lng_step
+]
 
 
 def get_reverse_geocoding_cache(lat: float, lng: float) -> dict | None:
     """
     Get reverse geocoding result from cache.
 
+    Falls back to the 8 neighbouring grid cells, so points just across a cell
+    boundary from a cached lookup still hit. A neighbour hit can come from a point
+    up to 2 cells (~22 meters) away along each axis, so up to ~31 meters diagonally.
+
     Args:
         lat: Latitude
         lng: Longitude
@@ -131,6 +202,17 @@ def get_reverse_geocoding_cache(lat: float, lng: float) -> dict | None:
     key = make_cache_key("reverse_geocode", lat_rounded, lng_rounded)
 
     result = geocoding_cache.get(key)
+    if not result:
+        for lat_step, lng_step in _NEIGHBOUR_STEPS:
+            neighbour_key = make_cache_key(
+                "reverse_geocode",
+                round(lat_rounded + lat_step, 4),
+                round(lng_rounded + lng_step, 4),
+            )
+            result = geocoding_cache.get(neighbour_key)
+            if result:
+                break
+
     if result:
         cache_stats["geocoding_hits"] += 1
     else:
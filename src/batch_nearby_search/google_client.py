@@ -7,9 +7,11 @@ which supports modern place types like "fast_food_restaurant", "grocery_store",
 
 import asyncio
 import os
+from functools import lru_cache, partial
 from typing import Any
 import googlemaps
 import httpx
+import orjson
 from googlemaps.exceptions import ApiError, Timeout, TransportError
 
 from .cache import (
@@ -18,7 +20,44 @@ from .cache import (
     get_places_cache,
     set_places_cache,
 )
-from .utils import calculate_distance, normalize_place_type
+from .utils import (
+    calculate_distances,
+    filter_place_fields,
+    normalize_place_type,
+    resolve_place_fields,
+)
+
+# Places API (New) fields always requested: name, id, and location for distances
+BASE_PLACE_FIELD_MASK = ("places.displayName", "places.id", "places.location")
+
+# Places API (New) field needed for each optional include_fields value. Only the
+# requested fields go in the field mask, since Google bills by the fields returned.
+OPTIONAL_PLACE_FIELD_MASK = {
+    "rating": "places.rating",
+    "user_ratings_total": "places.userRatingCount",
+    "address": "places.formattedAddress",
+    "phone_number": "places.nationalPhoneNumber",
+    "website": "places.websiteUri",
+    "price_level": "places.priceLevel",
+    "opening_hours": "places.currentOpeningHours",
+    "types": "places.types",
+}
+
+# Seconds to wait on each connection warmup request
+WARMUP_TIMEOUT = 5
+
+
+@lru_cache(maxsize=64)
+def _places_field_mask(include_fields: tuple[str, ...]) -> str:
+    """Build the Places API field mask for a set of include_fields"""
+    optional_fields = sorted(
+        {
+            OPTIONAL_PLACE_FIELD_MASK[field]
+            for field in include_fields
+            if field in OPTIONAL_PLACE_FIELD_MASK
+        }
+    )
+    return ",".join((*BASE_PLACE_FIELD_MASK, *optional_fields))
 
 
 class GooglePlacesClient:
@@ -46,12 +85,25 @@ class GooglePlacesClient:
         # Legacy client for geocoding and distance matrix
         self.client = googlemaps.Client(key=self.api_key)
 
-        # HTTP client for new Places API
-        self.http_client = httpx.AsyncClient()
+        # Shared HTTP client for new Places API and Routes API. Reusing one client
+        # keeps connections pooled, so batches don't pay a TLS handshake per request,
+        # and HTTP/2 multiplexes concurrent searches over a single connection.
+        self.http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_concurrent * 2,
+                max_keepalive_connections=max_concurrent,
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
 
         self.semaphore = asyncio.Semaphore(max_concurrent)
         self.api_call_count = 0
 
+        # In-flight reverse geocode lookups, keyed like the reverse geocoding cache,
+        # so concurrent requests for the same spot share one API call
+        self._pending_reverse_geocodes: dict[tuple[float, float], asyncio.Future] = {}
+
         # New Places API endpoint
         self.places_api_url = "https://places.googleapis.com/v1/places:searchNearby"
 
@@ -125,13 +177,28 @@ class GooglePlacesClient:
         Raises:
             ValueError: If reverse geocoding fails or coordinates invalid
         """
-        from .cache import get_reverse_geocoding_cache, set_reverse_geocoding_cache
+        from .cache import get_reverse_geocoding_cache
 
         # Check cache first
         cached = get_reverse_geocoding_cache(lat, lng)
         if cached:
             return cached
 
+        # Join a lookup already in flight for the same spot instead of repeating it
+        key = (round(lat, 4), round(lng, 4))
+        pending = self._pending_reverse_geocodes.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch_reverse_geocode(lat, lng))
+            self._pending_reverse_geocodes[key] = pending
+            pending.add_done_callback(lambda _: self._pending_reverse_geocodes.pop(key, None))
+
+        # Shield so one cancelled caller doesn't cancel the lookup for the others
+        return await asyncio.shield(pending)
+
+    async def _fetch_reverse_geocode(self, lat: float, lng: float) -> dict:
+        """Call the Geocoding API for reverse_geocode_location and cache the result"""
+        from .cache import set_reverse_geocoding_cache
+
         # Call Google Geocoding API with latlng parameter
         try:
             latlng = f"{lat},{lng}"
@@ -169,12 +236,14 @@ class GooglePlacesClient:
         feature_type: str,
         radius: int = 5000,
         max_results: int = 3,
+        include_fields: list[str] | None = None,
     ) -> list[dict]:
         """
         Search for nearby places of a specific type with caching.
 
         Uses the NEW Google Places API (places.googleapis.com/v1) which supports
         modern place types like "fast_food_restaurant", "grocery_store", etc.
+        Only the fields needed for include_fields are requested from Google.
 
         Args:
             lat: Latitude
@@ -182,17 +251,44 @@ class GooglePlacesClient:
             feature_type: Place type (e.g., "park", "fast_food_restaurant", "grocery_store")
             radius: Search radius in meters
             max_results: Maximum number of results to return (1-20)
+            include_fields: Optional fields to include (rating, address, phone_number, etc.)
 
         Returns:
-            List of place dicts with distance_meters added
+            List of place dicts with name, place_id, distance_meters and requested fields
         """
         # Normalize feature type
         feature_type = normalize_place_type(feature_type)
 
+        # Request only the fields needed for include_fields
+        include_fields = tuple(include_fields or ())
+        field_mask = _places_field_mask(include_fields)
+        fields = resolve_place_fields(include_fields)
+
         # Check cache first
-        cached = get_places_cache(lat, lng, feature_type, radius)
-        if cached:
-            return cached[:max_results]
+        cached = get_places_cache(lat, lng, feature_type, radius, max_results, field_mask)
+        if cached is not None:
+            places = cached["places"]
+            if (cached["lat"], cached["lng"]) == (lat, lng):
+                return [filter_place_fields(place, fields) for place in places[:max_results]]
+
+            # A complete result from a nearby origin in the same grid cell: re-measure
+            # distances from this search point and drop places outside its radius.
+            # Places in the sliver of this circle outside the cached origin's (at most
+            # ~1/10 of the radius wide) are not covered; that approximation is accepted.
+            distances = calculate_distances(
+                lat,
+                lng,
+                [
+                    (place["geometry"]["location"]["lat"], place["geometry"]["location"]["lng"])
+                    for place in places
+                ],
+            )
+            in_radius = [i for i, distance in enumerate(distances) if distance <= radius]
+            nearest = sorted(in_radius, key=distances.__getitem__)[:max_results]
+            return [
+                filter_place_fields({**places[i], "distance_meters": distances[i]}, fields)
+                for i in nearest
+            ]
 
         # Call NEW Google Places API (Nearby Search)
         try:
@@ -217,7 +313,7 @@ class GooglePlacesClient:
                 headers = {
                     "Content-Type": "application/json",
                     "X-Goog-Api-Key": self.api_key,
-                    "X-Goog-FieldMask": "places.displayName,places.formattedAddress,places.location,places.rating,places.userRatingCount,places.nationalPhoneNumber,places.websiteUri,places.priceLevel,places.currentOpeningHours,places.types,places.id"
+                    "X-Goog-FieldMask": field_mask
                 }
 
                 # Make POST request
@@ -225,7 +321,6 @@ class GooglePlacesClient:
                     self.places_api_url,
                     json=request_body,
                     headers=headers,
-                    timeout=30.0
                 )
 
                 self.api_call_count += 1
@@ -235,23 +330,27 @@ class GooglePlacesClient:
                     error_detail = response.text
                     raise ValueError(f"Places API error ({response.status_code}): {error_detail}")
 
-                result = response.json()
+                result = orjson.loads(response.content)
                 places_raw = result.get("places", [])
 
-                # Transform new API response to legacy format for compatibility
-                places = []
+                # Extract locations, skipping places without one
+                located = []
                 for place_data in places_raw:
-                    # Extract location
                     location = place_data.get("location", {})
                     place_lat = location.get("latitude")
                     place_lng = location.get("longitude")
 
-                    if place_lat is None or place_lng is None:
-                        continue
+                    if place_lat is not None and place_lng is not None:
+                        located.append((place_data, place_lat, place_lng))
 
-                    # Calculate distance
-                    distance = calculate_distance(lat, lng, place_lat, place_lng)
+                # Calculate all distances from the search point in one batch
+                distances = calculate_distances(
+                    lat, lng, [(place_lat, place_lng) for _, place_lat, place_lng in located]
+                )
 
+                # Transform new API response to legacy format for compatibility
+                places = []
+                for (place_data, place_lat, place_lng), distance in zip(located, distances):
                     # Transform to legacy-compatible format
                     transformed_place = {
                         "name": place_data.get("displayName", {}).get("text", "Unknown"),
@@ -276,10 +375,14 @@ class GooglePlacesClient:
                     places.append(transformed_place)
 
                 # Already sorted by distance due to rankPreference
-                # Cache the full results
-                set_places_cache(lat, lng, feature_type, radius, places)
+                # Cache the full results; fewer places than requested means the API
+                # returned every place it had, so the list is complete
+                complete = len(places_raw) < request_body["maxResultCount"]
+                set_places_cache(
+                    lat, lng, feature_type, radius, max_results, field_mask, places, complete
+                )
 
-                return places[:max_results]
+                return [filter_place_fields(place, fields) for place in places[:max_results]]
 
         except httpx.HTTPError as e:
             raise ValueError(f"Places API HTTP error for {feature_type}: {str(e)}")
@@ -292,6 +395,7 @@ class GooglePlacesClient:
         feature_types: list[str],
         radius: int = 5000,
         max_results_per_type: int = 3,
+        include_fields: list[str] | None = None,
     ) -> list[dict]:
         """
         Search for nearby places across multiple locations and feature types in parallel.
@@ -301,44 +405,46 @@ class GooglePlacesClient:
             feature_types: List of place types to search for
             radius: Search radius in meters
             max_results_per_type: Max results per feature type
+            include_fields: Optional fields to include (rating, address, phone_number, etc.)
 
         Returns:
             List of dicts with {location, feature_type, places, error}
         """
-        # Create all tasks
-        tasks = []
-        task_metadata = []
-
-        for i, location in enumerate(locations):
-            for feature_type in feature_types:
-                task = self.nearby_search(
-                    location["lat"],
-                    location["lng"],
-                    feature_type,
-                    radius,
-                    max_results_per_type,
-                )
-                tasks.append(task)
-                task_metadata.append(
-                    {
-                        "location_index": i,
-                        "location": location,
-                        "feature_type": feature_type,
-                    }
+        # Execute all searches in parallel (with rate limiting via semaphore);
+        # each one captures its own failure
+        return await asyncio.gather(
+            *(
+                self._batch_search_entry(
+                    i, location, feature_type, radius, max_results_per_type, include_fields
                 )
+                for i, location in enumerate(locations)
+                for feature_type in feature_types
+            )
+        )
 
-        # Execute all tasks in parallel (with rate limiting via semaphore)
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Combine results with metadata
-        combined = []
-        for metadata, result in zip(task_metadata, results):
-            if isinstance(result, Exception):
-                combined.append({**metadata, "places": [], "error": str(result)})
-            else:
-                combined.append({**metadata, "places": result, "error": None})
+    async def _batch_search_entry(
+        self,
+        location_index: int,
+        location: dict,
+        feature_type: str,
+        radius: int,
+        max_results: int,
+        include_fields: list[str] | None,
+    ) -> dict:
+        """Run one nearby search for batch_nearby_search, returning an error entry on failure"""
+        entry = {
+            "location_index": location_index,
+            "location": location,
+            "feature_type": feature_type,
+        }
+        try:
+            places = await self.nearby_search(
+                location["lat"], location["lng"], feature_type, radius, max_results, include_fields
+            )
+        except (httpx.HTTPError, ValueError, KeyError) as e:
+            return {**entry, "places": [], "error": str(e)}
 
-        return combined
+        return {**entry, "places": places, "error": None}
 
     async def distance_matrix(
         self,
@@ -460,7 +566,6 @@ class GooglePlacesClient:
                     self.routes_api_url,
                     json=request_body,
                     headers=headers,
-                    timeout=30.0
                 )
 
                 self.api_call_count += 1
@@ -470,7 +575,7 @@ class GooglePlacesClient:
                     error_detail = response.text
                     raise ValueError(f"Routes API error ({response.status_code}): {error_detail}")
 
-                result = response.json()
+                result = orjson.loads(response.content)
                 routes = result.get("routes", [])
 
                 if not routes:
@@ -502,6 +607,39 @@ class GooglePlacesClient:
         except Exception as e:
             raise ValueError(f"Routes API error: {str(e)}")
 
+    async def warmup(self) -> None:
+        """
+        Open connections to the Google API hosts ahead of the first tool call.
+
+        Resolves DNS and completes the TLS handshakes so the first real request
+        doesn't pay for them. Best effort: failures are ignored, since the real
+        request will simply open its own connection.
+        """
+        loop = asyncio.get_running_loop()
+        # The Places and Routes endpoints only accept POST, so connect via the host roots
+        hosts = {httpx.URL(url).host for url in (self.places_api_url, self.routes_api_url)}
+        await asyncio.gather(
+            *(
+                self.http_client.head(f"https://{host}/", timeout=WARMUP_TIMEOUT)
+                for host in hosts
+            ),
+            # Geocoding goes through googlemaps' requests session. Cancelling warmup
+            # doesn't stop the executor thread, so bound it with a timeout
+            loop.run_in_executor(
+                None,
+                partial(
+                    self.client.session.head,
+                    "https://maps.googleapis.com/",
+                    timeout=WARMUP_TIMEOUT,
+                ),
+            ),
+            return_exceptions=True,
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections (call once on server shutdown)"""
+        await self.http_client.aclose()
+
     def get_api_call_count(self) -> int:
         """Get the number of API calls made in this session"""
         return self.api_call_count
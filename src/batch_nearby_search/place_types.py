@@ -248,13 +248,21 @@ PLACE_TYPES_BY_CATEGORY = {
     ],
 }
 
+# Freeze each category's types so the shared lists can't be mutated at runtime
+PLACE_TYPES_BY_CATEGORY = {
+    category: tuple(types) for category, types in PLACE_TYPES_BY_CATEGORY.items()
+}
+
 # Flatten all types for validation and fuzzy matching
 ALL_PLACE_TYPES = set()
 for types in PLACE_TYPES_BY_CATEGORY.values():
     ALL_PLACE_TYPES.update(types)
 
-# Convert to sorted list for consistent ordering
-ALL_PLACE_TYPES = sorted(ALL_PLACE_TYPES)
+# Convert to sorted tuple for consistent ordering
+ALL_PLACE_TYPES = tuple(sorted(ALL_PLACE_TYPES))
+
+# Set view for O(1) membership checks during validation
+_PLACE_TYPE_SET = frozenset(ALL_PLACE_TYPES)
 
 
 def suggest_place_types(invalid_type: str, max_suggestions: int = 5) -> list[str]:
@@ -279,7 +287,7 @@ def suggest_place_types(invalid_type: str, max_suggestions: int = 5) -> list[str
     invalid_type = invalid_type.lower().strip()
 
     # Try exact match first
-    if invalid_type in ALL_PLACE_TYPES:
+    if invalid_type in _PLACE_TYPE_SET:
         return [invalid_type]
 
     # Fuzzy match with 60% similarity threshold
@@ -335,7 +343,7 @@ def validate_place_types(place_types: list[str]) -> dict:
         normalized = place_type.lower().strip()
 
         # Check if it's a valid place type
-        if normalized in ALL_PLACE_TYPES:
+        if normalized in _PLACE_TYPE_SET:
             valid.append(normalized)
         # Check if it's a category name
         elif normalized in PLACE_TYPES_BY_CATEGORY:
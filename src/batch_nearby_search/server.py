@@ -14,11 +14,12 @@ Tools:
 """
 
 import asyncio
-import json
+import functools
 import os
+from contextlib import asynccontextmanager
 from typing import Literal
 from dotenv import load_dotenv
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
 from .models import (
     Location,
@@ -29,15 +30,17 @@ from .models import (
     AVAILABLE_FIELDS,
 )
 from .google_client import GooglePlacesClient
-from .cache import get_cache_stats
+from .cache import get_cache_stats, make_cache_key
 from .utils import (
+    canonicalize_address,
     parse_string_or_array,
-    filter_place_fields,
     format_batch_search_results,
     format_nearby_search_results,
     format_distance_matrix_results,
     format_geocode_results,
     format_reverse_geocode_results,
+    format_route_results,
+    validate_coordinates,
 )
 from .place_types import (
     PLACE_TYPES_BY_CATEGORY,
@@ -49,20 +52,140 @@ from .place_types import (
 # Load environment variables
 load_dotenv()
 
+
+async def _warm_up_google_client() -> None:
+    """Create the Google client and warm up its connections"""
+    # Creating the client validates the API key; a bad key is left to surface
+    # as a per-tool error rather than failing startup
+    await get_google_client().warmup()
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Warm up Google API connections on startup and close the pool on shutdown"""
+    # Warm up in the background so startup isn't held up by the network
+    warmup = None
+    if os.getenv("GOOGLE_MAPS_API_KEY"):
+        warmup = asyncio.create_task(_warm_up_google_client())
+
+    try:
+        yield
+    finally:
+        if warmup is not None:
+            warmup.cancel()
+            await asyncio.gather(warmup, return_exceptions=True)
+        if get_google_client.cache_info().currsize:
+            await get_google_client().aclose()
+
+
 # Initialize FastMCP server
-mcp = FastMCP("batch-nearby-search")
+mcp = FastMCP("batch-nearby-search", lifespan=lifespan)
+
+# Place type data is static, so the list_place_types responses are built once
+_CATEGORY_SIZES = {category: len(types) for category, types in PLACE_TYPES_BY_CATEGORY.items()}
+_AVAILABLE_CATEGORIES = tuple(PLACE_TYPES_BY_CATEGORY)
+_ALL_PLACE_TYPES_RESPONSE = {
+    "categories": PLACE_TYPES_BY_CATEGORY,
+    "total_categories": len(PLACE_TYPES_BY_CATEGORY),
+    "total_types": len(ALL_PLACE_TYPES),
+}
 
-# Initialize Google API client (will be created on first use)
-_google_client: GooglePlacesClient | None = None
+# Result count above which text formatting is moved off the event loop
+_THREADED_FORMAT_THRESHOLD = 200
 
 
+@functools.cache
 def get_google_client() -> GooglePlacesClient:
-    """Get or create the Google API client singleton"""
-    global _google_client
-    if _google_client is None:
-        max_concurrent = int(os.getenv("MAX_CONCURRENT_REQUESTS", "10"))
-        _google_client = GooglePlacesClient(max_concurrent=max_concurrent)
-    return _google_client
+    """Get or create the Google API client singleton (created on first use)"""
+    max_concurrent = int(os.getenv("MAX_CONCURRENT_REQUESTS", "10"))
+    return GooglePlacesClient(max_concurrent=max_concurrent)
+
+
+async def _resolve_location(client: GooglePlacesClient, location: Location) -> dict:
+    """Geocode a location if it has an address, returning {lat, lng, formatted_address}"""
+    if location.address:
+        return await client.geocode_location(location.address)
+    return {
+        "lat": location.lat,
+        "lng": location.lng,
+        "formatted_address": f"({location.lat}, {location.lng})",
+    }
+
+
+def _validate_coordinate(coord: dict) -> tuple[float | None, float | None, str | None]:
+    """Pull lat/lng out of a coordinate dict, returning (lat, lng, error or None)"""
+    lat = coord.get("lat")
+    lng = coord.get("lng")
+    if lat is None or lng is None:
+        return lat, lng, "Missing lat or lng"
+    if not validate_coordinates(lat, lng):
+        return lat, lng, "Invalid coordinates (lat must be -90 to 90, lng must be -180 to 180)"
+    return lat, lng, None
+
+
+def _coordinate_error(lat: float | None, lng: float | None, error: str) -> dict:
+    """Build a failed reverse geocoding result entry"""
+    return {"lat": lat, "lng": lng, "status": "error", "error": error}
+
+
+def _reverse_geocode_cache_key(coordinates: list, include_components: bool) -> str:
+    """Short key identifying a reverse_geocode request, so clients can reuse its response"""
+    return make_cache_key(
+        "reverse_geocode",
+        include_components,
+        *(
+            (coord.get("lat"), coord.get("lng")) if isinstance(coord, dict) else coord
+            for coord in coordinates
+        ),
+    )[:16]
+
+
+def _resolve_include_fields(include_fields: list[str] | None) -> tuple[str, ...]:
+    """Dedupe include_fields once per request, dropping names that aren't available fields"""
+    return tuple(field for field in dict.fromkeys(include_fields or ()) if field in AVAILABLE_FIELDS)
+
+
+@functools.lru_cache(maxsize=512)
+def _validate_and_warn(feature_types: tuple[str, ...]) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Validate place types and build warning messages for any invalid ones.
+
+    Memoized, since clients tend to repeat the same feature type lists.
+
+    Args:
+        feature_types: Place types (or category names) requested by the caller
+
+    Returns:
+        Tuple of (valid place types, warning messages)
+    """
+    validation = validate_place_types(feature_types)
+    valid_types = tuple(validation["valid"])
+    warnings = []
+
+    if not validation["all_valid"]:
+        # Build helpful warning messages for each invalid type in a single pass
+        suggestions = validation["suggestions"]
+        invalid_msgs = "\n".join(
+            f"  - '{invalid_type}' is not valid. Did you mean: {', '.join(suggestions[invalid_type][:3])}?"
+            if suggestions.get(invalid_type)
+            else f"  - '{invalid_type}' is not valid. Use list_place_types() to see all options."
+            for invalid_type in validation["invalid"]
+        )
+
+        # Create a comprehensive validation summary
+        if valid_types:
+            warnings.append(
+                f"Validation: {len(valid_types)} of {len(feature_types)} place types are valid. "
+                f"Proceeding with: {', '.join(valid_types)}\n"
+                f"Invalid types:\n{invalid_msgs}"
+            )
+        else:
+            warnings.append(
+                f"Validation: None of the {len(feature_types)} place types are valid.\n"
+                f"Invalid types:\n{invalid_msgs}"
+            )
+
+    return valid_types, tuple(warnings)
 
 
 @mcp.tool
@@ -100,49 +223,50 @@ async def distance_matrix(
         # Call Distance Matrix API
         result = await client.distance_matrix(origins, destinations, mode)
 
-        # Parse and structure the results
-        parsed_results = []
-
-        for i, row in enumerate(result["rows"]):
-            origin = origins[i] if i < len(origins) else "Unknown"
-
-            for j, element in enumerate(row["elements"]):
-                destination = destinations[j] if j < len(destinations) else "Unknown"
-
-                distance_meters = None
-                duration_seconds = None
-
-                if element["status"] == "OK":
-                    distance_meters = element["distance"]["value"]
-                    duration_seconds = element["duration"]["value"]
-
-                parsed_results.append(
-                    {
-                        "origin": origin,
-                        "destination": destination,
-                        "distance_meters": distance_meters,
-                        "duration_seconds": duration_seconds,
-                        "status": element["status"],
-                    }
-                )
+        # Parse into compact (origin, destination, distance, duration, status) rows;
+        # per-pair dicts are only built when JSON output is requested
+        rows = []
+
+        # Google returns one row per origin and one element per destination, in order
+        for origin, row in zip(origins, result["rows"]):
+            for destination, element in zip(destinations, row["elements"]):
+                status = element["status"]
+
+                if status == "OK":
+                    rows.append(
+                        (
+                            origin,
+                            destination,
+                            element["distance"]["value"],
+                            element["duration"]["value"],
+                            status,
+                        )
+                    )
+                else:
+                    rows.append((origin, destination, None, None, status))
 
-        structured_data = {
-            "results": parsed_results,
-            "summary": {
-                "total_pairs": len(parsed_results),
-                "mode": mode,
-                "api_calls": 1,
-            },
+        summary = {
+            "total_pairs": len(rows),
+            "mode": mode,
+            "api_calls": 1,
         }
 
         # Return based on format
         if format == "json":
-            return structured_data
+            parsed_results = [
+                {
+                    "origin": origin,
+                    "destination": destination,
+                    "distance_meters": distance_meters,
+                    "duration_seconds": duration_seconds,
+                    "status": status,
+                }
+                for origin, destination, distance_meters, duration_seconds, status in rows
+            ]
+            return {"results": parsed_results, "summary": summary}
         else:
             # Text mode (default): return human-readable log format
-            return format_distance_matrix_results(
-                parsed_results, structured_data["summary"]
-            )
+            return format_distance_matrix_results(rows, summary)
 
     except Exception as e:
         error_data = {"error": str(e), "results": []}
@@ -203,43 +327,11 @@ async def nearby_search(
         if not feature_types:
             feature_types = []
 
-        # Parse include_fields if it's a stringified array
-        include_fields = parse_string_or_array(include_fields)
+        # Parse include_fields if it's a stringified array, resolved once per request
+        include_fields = _resolve_include_fields(parse_string_or_array(include_fields))
 
         # Validate place types and collect warnings
-        validation = validate_place_types(feature_types)
-        warnings = []
-
-        if not validation["all_valid"]:
-            # Build helpful warning messages for each invalid type
-            invalid_msgs = []
-            for invalid_type in validation["invalid"]:
-                suggestions = validation["suggestions"].get(invalid_type, [])
-                if suggestions:
-                    suggestion_str = ", ".join(suggestions[:3])
-                    invalid_msgs.append(
-                        f"  - '{invalid_type}' is not valid. Did you mean: {suggestion_str}?"
-                    )
-                else:
-                    invalid_msgs.append(
-                        f"  - '{invalid_type}' is not valid. Use list_place_types() to see all options."
-                    )
-
-            # Create a comprehensive validation summary
-            valid_types = validation["valid"]
-            if valid_types:
-                warnings.append(
-                    f"Validation: {len(valid_types)} of {len(feature_types)} place types are valid. "
-                    f"Proceeding with: {', '.join(valid_types)}\n"
-                    f"Invalid types:\n" + "\n".join(invalid_msgs)
-                )
-            else:
-                warnings.append(
-                    f"Validation: None of the {len(feature_types)} place types are valid.\n"
-                    f"Invalid types:\n" + "\n".join(invalid_msgs)
-                )
-        else:
-            valid_types = validation["valid"]
+        valid_types, warnings = _validate_and_warn(tuple(feature_types))
 
         if not valid_types:
             error_msg = "Error: No valid place types provided"
@@ -262,26 +354,26 @@ async def nearby_search(
         else:
             lat, lng = location.lat, location.lng
 
-        # Search for each feature type in parallel
-        tasks = []
-        for feature_type in valid_types:
-            task = client.nearby_search(lat, lng, feature_type, radius_meters, max_results_per_type)
-            tasks.append(task)
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Search all feature types in parallel through the same path as
+        # batch_nearby_search; failures are captured per type
+        batch_results = await client.batch_nearby_search(
+            [{"lat": lat, "lng": lng}],
+            valid_types,
+            radius_meters,
+            max_results_per_type,
+            include_fields,
+        )
 
         # Organize results by feature type
-        features_dict = {}
-        total_places = 0
-
-        for feature_type, result in zip(valid_types, results):
-            if isinstance(result, Exception):
-                features_dict[feature_type] = {"error": str(result), "places": []}
-            else:
-                # Filter fields based on include_fields parameter
-                filtered_places = [filter_place_fields(place, include_fields) for place in result]
-                features_dict[feature_type] = {"places": filtered_places}
-                total_places += len(filtered_places)
+        features_dict = {
+            batch_result["feature_type"]: (
+                {"error": batch_result["error"], "places": []}
+                if batch_result["error"]
+                else {"places": batch_result["places"]}
+            )
+            for batch_result in batch_results
+        }
+        total_places = sum(len(feature["places"]) for feature in features_dict.values())
 
         structured_data = {
             "location": {"lat": lat, "lng": lng},
@@ -416,54 +508,20 @@ async def batch_nearby_search(
     if not feature_types:
         feature_types = []
 
-    # Parse include_fields if it's a stringified array
-    include_fields = parse_string_or_array(include_fields)
-
-    # Parse locations if it's a stringified array (for Location objects)
-    locations = parse_string_or_array(locations)
-    if not locations:
-        locations = []
+    # Parse include_fields if it's a stringified array, resolved once per request
+    include_fields = _resolve_include_fields(parse_string_or_array(include_fields))
 
-    # Convert dict locations to Location objects
-    locations = [
-        Location(**loc) if isinstance(loc, dict) else loc
-        for loc in locations
-    ]
+    # Parse locations if it's a stringified array, failing fast on oversized batches
+    locations = parse_string_or_array(locations) or []
+    if len(locations) > 20:
+        error = f"Too many locations: {len(locations)} (max 20 per request)"
+        if format == "json":
+            return {"error": error, "results": []}
+        else:
+            return f"Error: {error}"
 
     # Validate place types and collect warnings
-    validation = validate_place_types(feature_types)
-    warnings = []
-
-    if not validation["all_valid"]:
-        # Build helpful warning messages for each invalid type
-        invalid_msgs = []
-        for invalid_type in validation["invalid"]:
-            suggestions = validation["suggestions"].get(invalid_type, [])
-            if suggestions:
-                suggestion_str = ", ".join(suggestions[:3])
-                invalid_msgs.append(
-                    f"  - '{invalid_type}' is not valid. Did you mean: {suggestion_str}?"
-                )
-            else:
-                invalid_msgs.append(
-                    f"  - '{invalid_type}' is not valid. Use list_place_types() to see all options."
-                )
-
-        # Create a comprehensive validation summary
-        valid_types = validation["valid"]
-        if valid_types:
-            warnings.append(
-                f"Validation: {len(valid_types)} of {len(feature_types)} place types are valid. "
-                f"Proceeding with: {', '.join(valid_types)}\n"
-                f"Invalid types:\n" + "\n".join(invalid_msgs)
-            )
-        else:
-            warnings.append(
-                f"Validation: None of the {len(feature_types)} place types are valid.\n"
-                f"Invalid types:\n" + "\n".join(invalid_msgs)
-            )
-    else:
-        valid_types = validation["valid"]
+    valid_types, warnings = _validate_and_warn(tuple(feature_types))
 
     if not valid_types:
         error_msg = "Error: No valid place types provided"
@@ -493,63 +551,79 @@ async def batch_nearby_search(
     partial = 0
 
     try:
-        # Step 1: Geocode all addresses in parallel
-        geocode_tasks = []
-        for location in locations:
+        # Convert dict locations to Location objects
+        locations = [
+            loc if isinstance(loc, Location) else Location.model_validate(loc) for loc in locations
+        ]
+
+        # Step 1: Start geocoding each unique address once, in parallel
+        # (addresses that only differ in case or punctuation share one lookup)
+        geocode_tasks = {}
+        for loc in locations:
+            if loc.address:
+                key = canonicalize_address(loc.address)
+                if key not in geocode_tasks:
+                    geocode_tasks[key] = asyncio.ensure_future(client.geocode_location(loc.address))
+
+        async def resolve_and_search(location: Location) -> tuple[dict, list[dict]]:
+            """Resolve one location's coordinates, then search all feature types around it"""
             if location.address:
-                geocode_tasks.append(client.geocode_location(location.address))
+                try:
+                    coords = await geocode_tasks[canonicalize_address(location.address)]
+                except (ValueError, KeyError) as e:
+                    return {"error": str(e)}, []
             else:
                 # Already have coordinates
-                geocode_tasks.append(
-                    asyncio.sleep(0, result={"lat": location.lat, "lng": location.lng})
-                )
+                coords = {"lat": location.lat, "lng": location.lng}
 
-        geocoded = await asyncio.gather(*geocode_tasks, return_exceptions=True)
-
-        # Step 2: Build coordinate list
-        coords_list = []
-        for i, result in enumerate(geocoded):
-            if isinstance(result, Exception):
-                coords_list.append({"error": str(result)})
-            else:
-                coords_list.append(result)
+            return coords, await client.batch_nearby_search(
+                [coords], valid_types, radius_meters, max_results_per_type, include_fields
+            )
 
-        # Step 3: Batch nearby search for all locations × feature types
-        batch_results = await client.batch_nearby_search(
-            [c for c in coords_list if "error" not in c],
-            valid_types,
-            radius_meters,
-            max_results_per_type,
-        )
+        # Steps 2-3: Search each location as soon as its own geocode finishes,
+        # rather than waiting for the slowest address in the batch
+        searched = await asyncio.gather(*(resolve_and_search(location) for location in locations))
 
-        # Step 4: Organize results by location
-        location_map = {}
-        for batch_result in batch_results:
-            loc_idx = batch_result["location_index"]
-            if loc_idx not in location_map:
-                location_map[loc_idx] = {
-                    "location_index": loc_idx,
-                    "location": locations[loc_idx].model_dump(),
-                    "coordinates": batch_result["location"],
-                    "features": {},
-                    "errors": [],
-                }
+        # Step 4: Organize results by location (in input order)
+        location_entries = []
+        for loc_idx, (location, (coords, batch_results)) in enumerate(zip(locations, searched)):
+            # The text formatter only reads these fields, so skip pydantic
+            # serialization unless the full model is being returned
+            if format == "json":
+                location_data = location.model_dump()
+            else:
+                location_data = {"address": location.address, "lat": location.lat, "lng": location.lng}
 
-            feature_type = batch_result["feature_type"]
-            if batch_result["error"]:
-                location_map[loc_idx]["errors"].append(
-                    f"{feature_type}: {batch_result['error']}"
+            if "error" in coords:
+                location_entries.append(
+                    {
+                        "location_index": loc_idx,
+                        "location": location_data,
+                        "coordinates": None,
+                        "features": {},
+                        "errors": [f"geocoding: {coords['error']}"],
+                    }
                 )
-            else:
-                # Filter fields based on include_fields parameter
-                filtered_places = [
-                    filter_place_fields(place, include_fields) for place in batch_result["places"]
-                ]
-                location_map[loc_idx]["features"][feature_type] = filtered_places
-                total_places_found += len(filtered_places)
+                continue
+
+            entry = {
+                "location_index": loc_idx,
+                "location": location_data,
+                "coordinates": coords,
+                "features": {},
+                "errors": [],
+            }
+            for batch_result in batch_results:
+                feature_type = batch_result["feature_type"]
+                error = batch_result["error"]
+                if error:
+                    entry["errors"].append(f"{feature_type}: {error}")
+                else:
+                    entry["features"][feature_type] = batch_result["places"]
+            location_entries.append(entry)
 
         # Step 5: Determine status for each location
-        for loc_idx, loc_data in location_map.items():
+        for loc_data in location_entries:
             has_results = len(loc_data["features"]) > 0
             has_errors = len(loc_data["errors"]) > 0
 
@@ -569,6 +643,10 @@ async def batch_nearby_search(
 
             location_results.append(loc_data)
 
+        total_places_found = sum(
+            len(places) for loc_data in location_results for places in loc_data["features"].values()
+        )
+
         # Build structured response
         structured_data = {
             "results": location_results,
@@ -672,38 +750,36 @@ async def list_place_types(categories: list[str] | str | None = None) -> dict:
         # Handle single string input or JSON-stringified array
         categories = parse_string_or_array(categories)
 
-        # Normalize category names
-        categories = [cat.lower().strip() for cat in categories]
-
         result = {}
         errors = []
 
         for category in categories:
-            if category in PLACE_TYPES_BY_CATEGORY:
-                result[category] = PLACE_TYPES_BY_CATEGORY[category]
-            else:
+            types = PLACE_TYPES_BY_CATEGORY.get(category)
+            if types is None:
+                # Normalize category names only when they don't match as given
+                category = category.lower().strip()
+                types = PLACE_TYPES_BY_CATEGORY.get(category)
+
+            if types is None:
                 errors.append(category)
+            else:
+                result[category] = types
 
         if errors:
             # Provide helpful error with available categories
-            available = list(PLACE_TYPES_BY_CATEGORY.keys())
             return {
                 "error": f"Unknown categories: {', '.join(errors)}",
-                "available_categories": available,
+                "available_categories": _AVAILABLE_CATEGORIES,
                 "valid_results": result if result else None,
             }
         else:
             return {
                 "categories": result,
-                "total_types": sum(len(types) for types in result.values()),
+                "total_types": sum(_CATEGORY_SIZES[category] for category in result),
             }
     else:
         # Return all types organized by category
-        return {
-            "categories": PLACE_TYPES_BY_CATEGORY,
-            "total_categories": len(PLACE_TYPES_BY_CATEGORY),
-            "total_types": len(ALL_PLACE_TYPES),
-        }
+        return _ALL_PLACE_TYPES_RESPONSE
 
 
 @mcp.tool
@@ -819,6 +895,7 @@ async def reverse_geocode(
     coordinates: list[dict] | dict,
     include_components: bool = False,
     format: Literal["text", "json"] | None = None,
+    ctx: Context | None = None,
 ) -> str | dict:
     """
     Convert coordinates to addresses (reverse geocoding).
@@ -844,63 +921,69 @@ async def reverse_geocode(
         ])
         # Batch reverse geocodes both locations in parallel
     """
-    client = get_google_client()
-
     # Handle single dict input or JSON-stringified array
-    coordinates = parse_string_or_array(coordinates)
+    coordinates = parse_string_or_array(coordinates) or []
+    cache_key = _reverse_geocode_cache_key(coordinates, include_components)
     if not coordinates:
-        coordinates = []
+        # Nothing to look up
+        if format == "json":
+            return {
+                "results": [],
+                "summary": {"total_coordinates": 0, "successful": 0, "failed": 0},
+                "cache_key": cache_key,
+            }
+        else:
+            return "No locations reverse geocoded"
 
+    client = get_google_client()
     results = []
     total_success = 0
     total_failed = 0
 
     try:
-        # Validate and reverse geocode all coordinates in parallel
-        reverse_geocode_tasks = []
+        # Validate and reverse geocode all coordinates in parallel; repeated
+        # coordinates share one lookup
+        reverse_geocode_tasks = {}
         valid_coords = []
 
         for coord in coordinates:
-            lat = coord.get("lat")
-            lng = coord.get("lng")
-
-            if lat is None or lng is None:
-                results.append({
-                    "lat": lat,
-                    "lng": lng,
-                    "status": "error",
-                    "error": "Missing lat or lng",
-                })
+            lat, lng, error = _validate_coordinate(coord)
+            if error:
+                results.append(_coordinate_error(lat, lng, error))
                 total_failed += 1
-            elif not (-90 <= lat <= 90) or not (-180 <= lng <= 180):
-                results.append({
-                    "lat": lat,
-                    "lng": lng,
-                    "status": "error",
-                    "error": "Invalid coordinates (lat must be -90 to 90, lng must be -180 to 180)",
-                })
-                total_failed += 1
-            else:
-                reverse_geocode_tasks.append(client.reverse_geocode_location(lat, lng))
-                valid_coords.append(coord)
+                continue
+
+            if (lat, lng) not in reverse_geocode_tasks:
+                reverse_geocode_tasks[(lat, lng)] = client.reverse_geocode_location(lat, lng)
+            valid_coords.append((lat, lng))
 
         # Execute all valid reverse geocoding tasks
         if reverse_geocode_tasks:
-            geocoded = await asyncio.gather(*reverse_geocode_tasks, return_exceptions=True)
+            lookups = reverse_geocode_tasks.values()
+            if ctx is not None:
+                # Report progress as lookups finish, so clients can follow large batches
+                total = len(reverse_geocode_tasks)
+                completed = 0
 
-            # Process results
-            for i, result in enumerate(geocoded):
-                original_coord = valid_coords[i]
-                lat = original_coord["lat"]
-                lng = original_coord["lng"]
+                async def with_progress(lookup):
+                    nonlocal completed
+                    try:
+                        return await lookup
+                    finally:
+                        completed += 1
+                        await ctx.report_progress(completed, total)
+
+                lookups = [with_progress(lookup) for lookup in lookups]
+
+            geocoded = await asyncio.gather(*lookups, return_exceptions=True)
+            geocoded_by_coord = dict(zip(reverse_geocode_tasks, geocoded))
+
+            # Process results, fanning shared lookups back out to each input
+            for lat, lng in valid_coords:
+                result = geocoded_by_coord[(lat, lng)]
 
                 if isinstance(result, Exception):
-                    results.append({
-                        "lat": lat,
-                        "lng": lng,
-                        "status": "error",
-                        "error": str(result),
-                    })
+                    results.append(_coordinate_error(lat, lng, str(result)))
                     total_failed += 1
                 else:
                     result_dict = {
@@ -917,7 +1000,7 @@ async def reverse_geocode(
                     results.append(result_dict)
                     total_success += 1
 
-        # Build structured response
+        # Build structured response, keyed by the request so clients can reuse it
         structured_data = {
             "results": results,
             "summary": {
@@ -925,13 +1008,19 @@ async def reverse_geocode(
                 "successful": total_success,
                 "failed": total_failed,
             },
+            "cache_key": cache_key,
         }
 
         # Return based on format
         if format == "json":
             return structured_data
         else:
-            # Text mode (default): return human-readable log format
+            # Text mode (default): return human-readable log format. Large batches
+            # are formatted in a worker thread so other tool calls aren't stalled.
+            if len(results) > _THREADED_FORMAT_THRESHOLD:
+                return await asyncio.to_thread(
+                    format_reverse_geocode_results, results, structured_data["summary"]
+                )
             return format_reverse_geocode_results(results, structured_data["summary"])
 
     except Exception as e:
@@ -943,6 +1032,7 @@ async def reverse_geocode(
                 "successful": total_success,
                 "failed": total_failed,
             },
+            "cache_key": cache_key,
         }
 
         if format == "json":
@@ -1004,7 +1094,8 @@ async def optimize_route(
           "total_distance_meters": 550000,
           "total_duration_seconds": 19800,
           "travel_mode": "DRIVE",
-          "optimized": true
+          "optimized": true,
+          "cache_key": "3f9a0c1e5b7d2a84"
         }
 
     Important limits:
@@ -1028,47 +1119,40 @@ async def optimize_route(
             return {"error": error_msg}
         else:
             return error_msg
-
-    # Convert dict waypoints to Location objects
-    waypoints = [
-        Location(**wp) if isinstance(wp, dict) else wp
-        for wp in waypoints
-    ]
+    if len(waypoints) > 25:
+        # The Routes API would reject the request, so don't geocode anything
+        error_msg = f"Error: Maximum 25 waypoints ({len(waypoints)} given)"
+        if format == "json":
+            return {"error": error_msg}
+        else:
+            return error_msg
 
     try:
-        # Geocode origin
-        if origin.address:
-            origin_coords = await client.geocode_location(origin.address)
-            origin_lat, origin_lng = origin_coords["lat"], origin_coords["lng"]
-            origin_formatted = origin_coords["formatted_address"]
-        else:
-            origin_lat, origin_lng = origin.lat, origin.lng
-            origin_formatted = f"({origin_lat}, {origin_lng})"
-
-        # Geocode destination
-        if destination.address:
-            dest_coords = await client.geocode_location(destination.address)
-            dest_lat, dest_lng = dest_coords["lat"], dest_coords["lng"]
-            dest_formatted = dest_coords["formatted_address"]
-        else:
-            dest_lat, dest_lng = destination.lat, destination.lng
-            dest_formatted = f"({dest_lat}, {dest_lng})"
-
-        # Geocode all waypoints in parallel
-        waypoint_tasks = []
-        for waypoint in waypoints:
-            if waypoint.address:
-                waypoint_tasks.append(client.geocode_location(waypoint.address))
-            else:
-                waypoint_tasks.append(
-                    asyncio.sleep(0, result={"lat": waypoint.lat, "lng": waypoint.lng, "formatted_address": f"({waypoint.lat}, {waypoint.lng})"})
-                )
+        # Convert dict waypoints to Location objects
+        waypoints = [
+            wp if isinstance(wp, Location) else Location.model_validate(wp)
+            for wp in waypoints
+        ]
+
+        # Geocode origin, destination and all waypoints in parallel
+        origin_result, dest_result, *waypoint_results = await asyncio.gather(
+            _resolve_location(client, origin),
+            _resolve_location(client, destination),
+            *(_resolve_location(client, waypoint) for waypoint in waypoints),
+            return_exceptions=True,
+        )
 
-        waypoint_results = await asyncio.gather(*waypoint_tasks, return_exceptions=True)
+        # Origin and destination failures abort the whole route
+        for result in (origin_result, dest_result):
+            if isinstance(result, Exception):
+                raise result
 
-        # Build waypoint coordinate list
-        waypoint_coords = []
-        waypoint_details = []
+        origin_lat, origin_lng = origin_result["lat"], origin_result["lng"]
+        origin_formatted = origin_result["formatted_address"]
+        dest_lat, dest_lng = dest_result["lat"], dest_result["lng"]
+        dest_formatted = dest_result["formatted_address"]
+
+        # Any waypoint that failed to geocode aborts the route
         for i, result in enumerate(waypoint_results):
             if isinstance(result, Exception):
                 error_msg = f"Error geocoding waypoint {i}: {str(result)}"
@@ -1077,13 +1161,16 @@ async def optimize_route(
                 else:
                     return error_msg
 
-            waypoint_coords.append({"lat": result["lat"], "lng": result["lng"]})
-            waypoint_details.append({
+        # Build waypoint coordinate list
+        waypoint_coords = [{"lat": result["lat"], "lng": result["lng"]} for result in waypoint_results]
+        waypoint_details = [
+            {
                 "original_index": i,
-                "lat": result["lat"],
-                "lng": result["lng"],
-                "address": result.get("formatted_address", f"({result['lat']}, {result['lng']})")
-            })
+                **coords,
+                "address": result.get("formatted_address") or f"({coords['lat']}, {coords['lng']})",
+            }
+            for i, (coords, result) in enumerate(zip(waypoint_coords, waypoint_results))
+        ]
 
         # Call route optimization API
         route_result = await client.optimize_route(
@@ -1104,7 +1191,7 @@ async def optimize_route(
             for i, detail in enumerate(waypoint_details):
                 detail["optimized_index"] = i
 
-        # Build structured response
+        # Build structured response, keyed by the request so clients can reuse it
         structured_data = {
             "origin": {
                 "lat": origin_lat,
@@ -1122,7 +1209,13 @@ async def optimize_route(
             "total_duration_seconds": route_result["total_duration_seconds"],
             "polyline": route_result["polyline"],
             "travel_mode": route_result["travel_mode"],
-            "optimized": route_result["optimized"]
+            "optimized": route_result["optimized"],
+            "cache_key": make_cache_key(
+                "optimize_route",
+                travel_mode,
+                optimize_order,
+                *((loc.address, loc.lat, loc.lng) for loc in (origin, destination, *waypoints)),
+            )[:16],
         }
 
         # Return based on format
@@ -1130,42 +1223,7 @@ async def optimize_route(
             return structured_data
         else:
             # Text mode (default): return human-readable format
-            output_lines = []
-            output_lines.append("=== OPTIMIZED ROUTE ===\n")
-            output_lines.append(f"Origin: {origin_formatted}")
-            output_lines.append(f"Destination: {dest_formatted}")
-            output_lines.append(f"Travel Mode: {travel_mode}")
-            output_lines.append(f"Optimization: {'Enabled' if optimize_order else 'Disabled'}\n")
-
-            # Display waypoints in optimized order
-            if route_result["optimized_waypoint_order"]:
-                output_lines.append("Waypoints (optimized order):")
-                for optimized_idx in range(len(waypoint_details)):
-                    # Find waypoint with this optimized_index
-                    for detail in waypoint_details:
-                        if detail["optimized_index"] == optimized_idx:
-                            output_lines.append(
-                                f"  {optimized_idx + 1}. {detail['address']} "
-                                f"(originally #{detail['original_index'] + 1})"
-                            )
-                            break
-            else:
-                output_lines.append("Waypoints (original order):")
-                for i, detail in enumerate(waypoint_details):
-                    output_lines.append(f"  {i + 1}. {detail['address']}")
-
-            # Display summary
-            distance_km = route_result["total_distance_meters"] / 1000
-            duration_hours = route_result["total_duration_seconds"] / 3600
-            duration_minutes = (route_result["total_duration_seconds"] % 3600) / 60
-
-            output_lines.append(f"\nTotal Distance: {distance_km:.2f} km ({route_result['total_distance_meters']} meters)")
-            output_lines.append(f"Total Duration: {int(duration_hours)}h {int(duration_minutes)}m ({route_result['total_duration_seconds']} seconds)")
-
-            if route_result["polyline"]:
-                output_lines.append(f"\nEncoded Polyline: {route_result['polyline'][:50]}...")
-
-            return "\n".join(output_lines)
+            return format_route_results(structured_data, travel_mode, optimize_order)
 
     except Exception as e:
         error_msg = f"Error: {str(e)}"
@@ -1177,6 +1235,14 @@ async def optimize_route(
 
 def main():
     """Entry point for the MCP server"""
+    # Use uvloop's event loop when it is installed (pip install ".[speed]")
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     mcp.run()
 
 
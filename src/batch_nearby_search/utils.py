@@ -2,10 +2,13 @@
 Utility functions for the batch nearby search MCP server.
 """
 
-import json
 import math
+import re
+from functools import lru_cache
 from typing import Any, TypeVar
 
+import orjson
+
 T = TypeVar('T')
 
 
@@ -48,7 +51,7 @@ def parse_string_or_array(value: str | list[T] | T | None, item_type: type = str
         stripped = value.strip()
         if stripped.startswith('[') or stripped.startswith('{'):
             try:
-                parsed = json.loads(stripped)
+                parsed = orjson.loads(stripped)
                 # If parsed to a dict, wrap in list
                 if isinstance(parsed, dict):
                     return [parsed]
@@ -58,7 +61,7 @@ def parse_string_or_array(value: str | list[T] | T | None, item_type: type = str
                 # If parsed to something else, wrap it
                 else:
                     return [parsed]
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 # Not valid JSON, treat as single string
                 return [value]
         else:
@@ -69,13 +72,44 @@ def parse_string_or_array(value: str | list[T] | T | None, item_type: type = str
     return [value]
 
 
-def filter_place_fields(place: dict, include_fields: list[str] | None) -> dict:
+# Mapping from user-friendly field names to Google API field names
+FIELD_MAP = {
+    "rating": "rating",
+    "user_ratings_total": "user_ratings_total",
+    "address": "vicinity",  # Use vicinity for nearby search, formatted_address for details
+    "phone_number": "formatted_phone_number",
+    "website": "website",
+    "price_level": "price_level",
+    "opening_hours": "opening_hours",
+    "types": "types",
+}
+
+
+@lru_cache(maxsize=64)
+def resolve_place_fields(include_fields: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    """
+    Resolve include_fields to (user field, Google API field) pairs.
+
+    Done once per request rather than per place; unknown field names are dropped.
+
+    Args:
+        include_fields: Field names requested by the caller
+
+    Returns:
+        Tuple of (user field, API field) pairs for filter_place_fields
+    """
+    return tuple(
+        (user_field, FIELD_MAP[user_field]) for user_field in include_fields if user_field in FIELD_MAP
+    )
+
+
+def filter_place_fields(place: dict, fields: tuple[tuple[str, str], ...]) -> dict:
     """
     Extract only requested fields from Google Places API response.
 
     Args:
         place: Raw place dict from Google API
-        include_fields: List of field names to include, or None for minimal fields only
+        fields: (user field, API field) pairs from resolve_place_fields, empty for minimal fields only
 
     Returns:
         Filtered dict with requested fields
@@ -87,34 +121,30 @@ def filter_place_fields(place: dict, include_fields: list[str] | None) -> dict:
         "distance_meters": place.get("distance_meters"),
     }
 
-    if not include_fields:
-        return result
-
-    # Mapping from user-friendly field names to Google API field names
-    field_map = {
-        "rating": "rating",
-        "user_ratings_total": "user_ratings_total",
-        "address": "vicinity",  # Use vicinity for nearby search, formatted_address for details
-        "phone_number": "formatted_phone_number",
-        "website": "website",
-        "price_level": "price_level",
-        "opening_hours": "opening_hours",
-        "types": "types",
-    }
-
     # Add requested optional fields
-    for user_field in include_fields:
-        api_field = field_map.get(user_field)
-        if api_field and api_field in place:
+    for user_field, api_field in fields:
+        if api_field in place:
             result[user_field] = place[api_field]
 
     return result
 
 
+# Search radii are capped at 50 km. At that range the equirectangular approximation
+# stays within 0.3% of the haversine distance, using one cos call instead of the
+# haversine's four trig calls and a sqrt. Set to False to use the exact formula.
+_FAST_HAVERSINE = True
+
+# Degrees-to-radians factor, same value math.radians multiplies by
+_DEG2RAD = math.pi / 180
+
+
 def calculate_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
     """
     Calculate distance between two coordinates using Haversine formula.
 
+    Uses the equirectangular approximation instead while _FAST_HAVERSINE is set,
+    which is accurate for the short distances within a search radius.
+
     Args:
         lat1: Latitude of point 1
         lng1: Longitude of point 1
@@ -127,11 +157,16 @@ def calculate_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> fl
     # Earth's radius in meters
     R = 6371000
 
+    if _FAST_HAVERSINE:
+        x = (lng2 - lng1) * _DEG2RAD * math.cos((lat1 + lat2) / 2 * _DEG2RAD)
+        y = (lat2 - lat1) * _DEG2RAD
+        return R * math.hypot(x, y)
+
     # Convert to radians
-    lat1_rad = math.radians(lat1)
-    lat2_rad = math.radians(lat2)
-    delta_lat = math.radians(lat2 - lat1)
-    delta_lng = math.radians(lng2 - lng1)
+    lat1_rad = lat1 * _DEG2RAD
+    lat2_rad = lat2 * _DEG2RAD
+    delta_lat = (lat2 - lat1) * _DEG2RAD
+    delta_lng = (lng2 - lng1) * _DEG2RAD
 
     # Haversine formula
     a = math.sin(delta_lat / 2) ** 2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(
@@ -142,6 +177,49 @@ def calculate_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> fl
     return R * c
 
 
+def calculate_distances(lat: float, lng: float, points: list[tuple[float, float]]) -> list[float]:
+    """
+    Calculate distances from one origin to many points.
+
+    Same result as calling calculate_distance per point (including the
+    _FAST_HAVERSINE approximation), but the origin's terms are only computed once.
+
+    Args:
+        lat: Latitude of the origin
+        lng: Longitude of the origin
+        points: List of (lat, lng) tuples
+
+    Returns:
+        Distances in meters, in the same order as points
+    """
+    # Earth's radius in meters
+    R = 6371000
+
+    if _FAST_HAVERSINE:
+        return [
+            R
+            * math.hypot(
+                (point_lng - lng) * _DEG2RAD * math.cos((lat + point_lat) / 2 * _DEG2RAD),
+                (point_lat - lat) * _DEG2RAD,
+            )
+            for point_lat, point_lng in points
+        ]
+
+    lat_rad = lat * _DEG2RAD
+    cos_lat = math.cos(lat_rad)
+
+    distances = []
+    for point_lat, point_lng in points:
+        delta_lat = (point_lat - lat) * _DEG2RAD
+        delta_lng = (point_lng - lng) * _DEG2RAD
+        a = math.sin(delta_lat / 2) ** 2 + cos_lat * math.cos(point_lat * _DEG2RAD) * math.sin(
+            delta_lng / 2
+        ) ** 2
+        distances.append(R * 2 * math.asin(math.sqrt(a)))
+
+    return distances
+
+
 def format_distance(meters: float) -> str:
     """
     Format distance in human-readable format.
@@ -167,14 +245,13 @@ def format_duration(seconds: int) -> str:
     Returns:
         Formatted string (e.g., "1h 23m" or "45m")
     """
-    if seconds >= 3600:
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
         return f"{hours}h {minutes}m"
-    elif seconds >= 60:
-        minutes = seconds // 60
+    elif minutes:
         return f"{minutes}m"
-    return f"{seconds}s"
+    return f"{secs}s"
 
 
 def validate_coordinates(lat: float, lng: float) -> bool:
@@ -191,10 +268,34 @@ def validate_coordinates(lat: float, lng: float) -> bool:
     return -90 <= lat <= 90 and -180 <= lng <= 180
 
 
+_ADDRESS_PUNCTUATION = re.compile(r"[,.#-]+")
+
+
+@lru_cache(maxsize=2048)
+def canonicalize_address(address: str) -> str:
+    """
+    Canonicalize an address for use in cache keys.
+
+    Lowercases, turns commas, periods, hyphens and '#' into spaces, and collapses
+    whitespace, so "123 Main St., Springfield" and "123 main st springfield"
+    share a geocoding cache entry.
+
+    Args:
+        address: Raw address string
+
+    Returns:
+        Canonical address string
+    """
+    return " ".join(_ADDRESS_PUNCTUATION.sub(" ", address.lower()).split())
+
+
+@lru_cache(maxsize=512)
 def normalize_place_type(place_type: str) -> str:
     """
     Normalize place type to lowercase and replace spaces with underscores.
 
+    Memoized, since the same handful of types is normalized on every search.
+
     Args:
         place_type: Raw place type string
 
@@ -222,7 +323,7 @@ def format_batch_search_results(results: list[dict], summary: dict) -> str:
     # Iterate through each location
     for result in results:
         location = result.get("location", {})
-        coords = result.get("coordinates", {})
+        coords = result.get("coordinates") or {}
         features = result.get("features", {})
 
         # Format location identifier
@@ -231,33 +332,32 @@ def format_batch_search_results(results: list[dict], summary: dict) -> str:
         else:
             loc_str = f"{location.get('lat', coords.get('lat', '?'))}, {location.get('lng', coords.get('lng', '?'))}"
 
-        # Format coordinates
-        lat = coords.get("lat", location.get("lat", "?"))
-        lng = coords.get("lng", location.get("lng", "?"))
-        coord_str = f"({lat}, {lng})"
+        # Format coordinates (missing when the address could not be geocoded)
+        lat = coords.get("lat", location.get("lat"))
+        lng = coords.get("lng", location.get("lng"))
+        coord_str = f"({lat}, {lng})" if lat is not None and lng is not None else "(?, ?)"
 
         # Iterate through each feature type and place
-        for feature_type, places in features.items():
-            if isinstance(places, list):
-                for place in places:
-                    name = place.get("name", "Unknown")
-                    distance = place.get("distance_meters")
+        for places in features.values():
+            for place in places:
+                name = place.get("name", "Unknown")
+                distance = place.get("distance_meters")
 
-                    # Build the log line: - <location> <coords> "<name>" <distance> meters
-                    line_parts = ["-", loc_str, coord_str, f'"{name}"']
+                # Build the log line: - <location> <coords> "<name>" <distance> meters
+                line = f'- {loc_str} {coord_str} "{name}"'
 
-                    if distance is not None:
-                        line_parts.append(f"{int(distance)} meters")
+                if distance is not None:
+                    line += f" {int(distance)} meters"
 
-                    # Add optional fields if present
-                    if "rating" in place and place["rating"]:
-                        line_parts.append(f"[rating: {place['rating']:.1f}]")
-                    if "address" in place and place["address"]:
-                        line_parts.append(f"[addr: {place['address']}]")
-                    if "phone_number" in place and place["phone_number"]:
-                        line_parts.append(f"[tel: {place['phone_number']}]")
+                # Add optional fields if present
+                if place.get("rating"):
+                    line += f" [rating: {place['rating']:.1f}]"
+                if place.get("address"):
+                    line += f" [addr: {place['address']}]"
+                if place.get("phone_number"):
+                    line += f" [tel: {place['phone_number']}]"
 
-                    lines.append(" ".join(line_parts))
+                lines.append(line)
 
         # Add errors if any
         if "errors" in result and result["errors"]:
@@ -291,42 +391,40 @@ def format_nearby_search_results(
     coord_str = f"({lat}, {lng})"
 
     # Iterate through each feature type and place
-    for feature_type, data in features.items():
-        if isinstance(data, dict) and "places" in data:
-            places = data["places"]
-            for place in places:
-                name = place.get("name", "Unknown")
-                distance = place.get("distance_meters")
+    for data in features.values():
+        if data.get("error"):
+            lines.append(f"- {coord_str} ERROR: {data['error']}")
+        for place in data["places"]:
+            name = place.get("name", "Unknown")
+            distance = place.get("distance_meters")
 
-                # Build the log line: - <coords> "<name>" <distance> meters
-                line_parts = ["-", coord_str, f'"{name}"']
+            # Build the log line: - <coords> "<name>" <distance> meters
+            line_parts = ["-", coord_str, f'"{name}"']
 
-                if distance is not None:
-                    line_parts.append(f"{int(distance)} meters")
+            if distance is not None:
+                line_parts.append(f"{int(distance)} meters")
 
-                # Add optional fields if present
-                if "rating" in place and place["rating"]:
-                    line_parts.append(f"[rating: {place['rating']:.1f}]")
-                if "address" in place and place["address"]:
-                    line_parts.append(f"[addr: {place['address']}]")
-                if "phone_number" in place and place["phone_number"]:
-                    line_parts.append(f"[tel: {place['phone_number']}]")
-
-                lines.append(" ".join(line_parts))
-        elif isinstance(data, dict) and "error" in data:
-            lines.append(f"- {coord_str} ERROR: {data['error']}")
+            # Add optional fields if present
+            if "rating" in place and place["rating"]:
+                line_parts.append(f"[rating: {place['rating']:.1f}]")
+            if "address" in place and place["address"]:
+                line_parts.append(f"[addr: {place['address']}]")
+            if "phone_number" in place and place["phone_number"]:
+                line_parts.append(f"[tel: {place['phone_number']}]")
+
+            lines.append(" ".join(line_parts))
 
     return "\n".join(lines) if lines else "No places found"
 
 
-def format_distance_matrix_results(results: list[dict], summary: dict) -> str:
+def format_distance_matrix_results(results: list[tuple], summary: dict) -> str:
     """
     Format distance matrix results in log-style output.
 
     Each line shows: origin -> destination, distance, duration.
 
     Args:
-        results: List of origin-destination pairs
+        results: List of (origin, destination, distance_meters, duration_seconds, status) tuples
         summary: Summary statistics
 
     Returns:
@@ -334,13 +432,7 @@ def format_distance_matrix_results(results: list[dict], summary: dict) -> str:
     """
     lines = []
 
-    for result in results:
-        origin = result.get("origin", "Unknown")
-        destination = result.get("destination", "Unknown")
-        distance = result.get("distance_meters")
-        duration = result.get("duration_seconds")
-        status = result.get("status", "UNKNOWN")
-
+    for origin, destination, distance, duration, status in results:
         if status == "OK" and distance and duration:
             lines.append(
                 f"- {origin} -> {destination} "
@@ -419,3 +511,53 @@ def format_reverse_geocode_results(results: list[dict], summary: dict) -> str:
             lines.append(f"- {coord_str} ERROR: {error}")
 
     return "\n".join(lines) if lines else "No locations reverse geocoded"
+
+
+def format_route_results(route: dict, travel_mode: str, optimize_order: bool) -> str:
+    """
+    Format an optimized route as a human-readable summary.
+
+    Args:
+        route: Structured route data (origin, destination, waypoints, totals, polyline)
+        travel_mode: Travel mode requested by the caller
+        optimize_order: Whether waypoint optimization was requested
+
+    Returns:
+        Route summary with waypoints listed in visiting order
+    """
+    lines = [
+        "=== OPTIMIZED ROUTE ===\n",
+        f"Origin: {route['origin']['address']}",
+        f"Destination: {route['destination']['address']}",
+        f"Travel Mode: {travel_mode}",
+        f"Optimization: {'Enabled' if optimize_order else 'Disabled'}\n",
+    ]
+
+    # Display waypoints in optimized order
+    waypoints = route["waypoints"]
+    optimized_order = route["optimized_waypoint_order"]
+    if optimized_order:
+        lines.append("Waypoints (optimized order):")
+        for optimized_idx, original_idx in enumerate(optimized_order):
+            lines.append(
+                f"  {optimized_idx + 1}. {waypoints[original_idx]['address']} "
+                f"(originally #{original_idx + 1})"
+            )
+    else:
+        lines.append("Waypoints (original order):")
+        for i, waypoint in enumerate(waypoints):
+            lines.append(f"  {i + 1}. {waypoint['address']}")
+
+    # Display summary
+    distance_meters = route["total_distance_meters"]
+    duration_seconds = route["total_duration_seconds"]
+    hours, remainder = divmod(int(duration_seconds), 3600)
+
+    lines.append(f"\nTotal Distance: {distance_meters / 1000:.2f} km ({distance_meters} meters)")
+    lines.append(f"Total Duration: {hours}h {remainder // 60}m ({duration_seconds} seconds)")
+
+    polyline = route["polyline"]
+    if polyline:
+        lines.append(f"\nEncoded Polyline: {polyline[:50]}...")
+
+    return "\n".join(lines)
@@ -4,6 +4,7 @@ Tests for geocoding functionality
 
 import pytest
 import asyncio
+import time
 from unittest.mock import Mock, AsyncMock, patch
 from src.batch_nearby_search.google_client import GooglePlacesClient
 from src.batch_nearby_search.cache import (
@@ -95,6 +96,40 @@ def test_reverse_geocoding_cache_rounding():
     assert cached["formatted_address"] == "Test Address"
 
 
+def test_reverse_geocoding_cache_neighbour_cell():
+    """Test that a lookup in an adjacent grid cell is served from the cache"""
+    address_data = {"lat": 37.4220, "lng": -122.0841, "formatted_address": "Test Address"}
+    set_reverse_geocoding_cache(37.4220, -122.0841, address_data)
+
+    # One cell north-east, ~15 meters away
+    cached = get_reverse_geocoding_cache(37.4221, -122.0840)
+    assert cached is not None
+    assert cached["formatted_address"] == "Test Address"
+
+
+@pytest.mark.asyncio
+async def test_reverse_geocode_location_outside_neighbour_cells():
+    """Test that a point two cells from a cached lookup still calls the API"""
+    client = GooglePlacesClient(api_key='AIzaFakeKeyForTests', max_concurrent=5)
+    set_reverse_geocoding_cache(
+        37.4220, -122.0841, {"lat": 37.4220, "lng": -122.0841, "formatted_address": "Cached"}
+    )
+
+    mock_result = [{
+        "formatted_address": "Fresh Address",
+        "place_id": "test_place_id",
+        "address_components": [],
+    }]
+
+    with patch.object(
+        client.client, 'reverse_geocode', return_value=mock_result
+    ) as mock_reverse_geocode:
+        result = await client.reverse_geocode_location(37.4222, -122.0841)
+
+        assert mock_reverse_geocode.call_count == 1
+        assert result["formatted_address"] == "Fresh Address"
+
+
 @pytest.mark.asyncio
 async def test_reverse_geocode_location_with_mock():
     """Test reverse_geocode_location method with mocked Google API"""
@@ -147,5 +182,49 @@ async def test_reverse_geocode_location_caching():
             assert result1["formatted_address"] == result2["formatted_address"]
 
 
+@pytest.mark.asyncio
+async def test_reverse_geocode_location_coalesces_concurrent_lookups():
+    """Test that concurrent lookups for the same grid cell share one API call"""
+    client = GooglePlacesClient(api_key='AIzaFakeKeyForTests', max_concurrent=5)
+
+    mock_result = [{
+        "formatted_address": "Test Address",
+        "place_id": "test_place_id",
+        "address_components": [],
+    }]
+
+    def slow_reverse_geocode(latlng):
+        time.sleep(0.05)
+        return mock_result
+
+    with patch.object(
+        client.client, 'reverse_geocode', side_effect=slow_reverse_geocode
+    ) as mock_reverse_geocode:
+        # Both points round to the same ~11 meter cell
+        result1, result2 = await asyncio.gather(
+            client.reverse_geocode_location(37.42201, -122.08411),
+            client.reverse_geocode_location(37.42199, -122.08409),
+        )
+
+        assert mock_reverse_geocode.call_count == 1
+        assert result1 == result2
+        assert client._pending_reverse_geocodes == {}
+
+
+@pytest.mark.asyncio
+async def test_reverse_geocode_location_failure_not_left_pending():
+    """Test that a failed lookup is cleared so the next call retries the API"""
+    client = GooglePlacesClient(api_key='AIzaFakeKeyForTests', max_concurrent=5)
+
+    with patch.object(client.client, 'reverse_geocode', return_value=[]) as mock_reverse_geocode:
+        with pytest.raises(ValueError, match="No address found"):
+            await client.reverse_geocode_location(37.4220, -122.0841)
+        assert client._pending_reverse_geocodes == {}
+
+        with pytest.raises(ValueError, match="No address found"):
+            await client.reverse_geocode_location(37.4220, -122.0841)
+        assert mock_reverse_geocode.call_count == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
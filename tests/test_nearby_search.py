@@ -0,0 +1,102 @@
+"""
+Tests for nearby search caching
+"""
+
+import httpx
+import pytest
+
+from src.batch_nearby_search.cache import clear_caches, get_cache_stats
+from src.batch_nearby_search.google_client import GooglePlacesClient
+from src.batch_nearby_search.utils import calculate_distance
+
+
+@pytest.fixture(autouse=True)
+def clear_cache_before_test():
+    """Clear caches before each test"""
+    clear_caches()
+    yield
+    clear_caches()
+
+
+@pytest.fixture
+def places_client():
+    """Client whose Places API returns parks ~490 m apart, due north
+
+    Returns maxResultCount parks, or all client.available parks if there are fewer.
+    """
+    client = GooglePlacesClient(api_key="AIzaFakeKeyForTests", max_concurrent=5)
+    client.available = 20
+    requests = []
+
+    async def fake_post(url, json=None, headers=None, **kwargs):
+        requests.append(json)
+        center = json["locationRestriction"]["circle"]["center"]
+        places = [
+            {
+                "displayName": {"text": f"park-{i}"},
+                "id": f"places/park{i}",
+                "location": {
+                    "latitude": center["latitude"] + 0.0044 * (i + 1),
+                    "longitude": center["longitude"],
+                },
+            }
+            for i in range(min(json["maxResultCount"], client.available))
+        ]
+        return httpx.Response(200, json={"places": places}, request=httpx.Request("POST", url))
+
+    client.http_client.post = fake_post
+    client.requests = requests
+    return client
+
+
+async def test_cached_results_not_reused_for_larger_max_results(places_client):
+    """A nearby origin in the same grid cell asking for more results calls the API"""
+    first = await places_client.nearby_search(37.001, -122.001, "park", 10000, max_results=1)
+    second = await places_client.nearby_search(37.0049, -122.0049, "park", 10000, max_results=5)
+
+    assert len(first) == 1
+    assert len(second) == 5
+    assert len(places_client.requests) == 2
+
+
+async def test_incomplete_results_not_reused_for_nearby_origin(places_client):
+    """A full page of results from another origin may miss nearer places, so it isn't reused"""
+    await places_client.nearby_search(37.001, -122.001, "park", 10000, max_results=3)
+    await places_client.nearby_search(37.0049, -122.0049, "park", 10000, max_results=3)
+
+    assert len(places_client.requests) == 2
+    assert get_cache_stats()["places"]["misses"] == 2
+
+
+async def test_complete_results_remeasured_for_nearby_origin(places_client):
+    """A complete cached result from a nearby origin is served with re-measured distances"""
+    places_client.available = 2
+    await places_client.nearby_search(37.001, -122.001, "park", 10000, max_results=3)
+    places = await places_client.nearby_search(37.0049, -122.0049, "park", 10000, max_results=3)
+
+    assert len(places_client.requests) == 1
+    assert [place["distance_meters"] for place in places] == [
+        calculate_distance(37.0049, -122.0049, 37.001 + 0.0044 * i, -122.001) for i in (1, 2)
+    ]
+
+
+async def test_repeated_search_with_fewer_results_uses_cache(places_client):
+    """Repeating a search that returned fewer places than requested is served from the cache"""
+    places_client.available = 1
+    for _ in range(3):
+        places = await places_client.nearby_search(37.0, -122.0, "park", 5000, max_results=3)
+        assert len(places) == 1
+
+    assert len(places_client.requests) == 1
+    assert get_cache_stats()["places"]["hits"] == 2
+
+
+async def test_cached_results_outside_radius_dropped(places_client):
+    """Places from a complete cached result that fall outside the new origin's radius are dropped"""
+    places_client.available = 2
+    await places_client.nearby_search(37.0004, -122.0, "park", 1000, max_results=3)
+    # Same ~110 m grid cell, but the second cached park is ~1020 m from here
+    places = await places_client.nearby_search(37.0, -122.0, "park", 1000, max_results=3)
+
+    assert len(places_client.requests) == 1
+    assert [place["name"] for place in places] == ["park-0"]
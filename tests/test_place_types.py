@@ -0,0 +1,26 @@
+"""
+Tests for place type validation
+"""
+
+from src.batch_nearby_search.place_types import validate_place_types
+
+
+def test_validate_place_types_returns_lists():
+    """Validation results use lists, with categories expanded"""
+    result = validate_place_types(["park", "restraunt", "gym"])
+
+    assert result["valid"] == ["park", "gym"]
+    assert result["invalid"] == ["restraunt"]
+    assert "restaurant" in result["suggestions"]["restraunt"]
+    assert result["all_valid"] is False
+
+
+def test_validate_place_types_results_are_independent():
+    """Mutating one result does not change later results for the same input"""
+    first = validate_place_types(["park", "restraunt"])
+    first["valid"].append("gym")
+    first["suggestions"]["restraunt"].clear()
+
+    second = validate_place_types(["park", "restraunt"])
+    assert second["valid"] == ["park"]
+    assert "restaurant" in second["suggestions"]["restraunt"]
@@ -0,0 +1,64 @@
+"""
+Tests for utility functions
+"""
+
+import math
+
+import pytest
+
+from src.batch_nearby_search import utils
+from src.batch_nearby_search.utils import (
+    calculate_distance,
+    calculate_distances,
+    canonicalize_address,
+)
+
+
+def offset_point(lat: float, lng: float, distance: float, bearing: float) -> tuple[float, float]:
+    """Destination point at distance meters and bearing degrees from (lat, lng)"""
+    angular = distance / 6371000
+    lat_rad = math.radians(lat)
+    bearing_rad = math.radians(bearing)
+
+    dest_lat = math.asin(
+        math.sin(lat_rad) * math.cos(angular)
+        + math.cos(lat_rad) * math.sin(angular) * math.cos(bearing_rad)
+    )
+    dest_lng = math.radians(lng) + math.atan2(
+        math.sin(bearing_rad) * math.sin(angular) * math.cos(lat_rad),
+        math.cos(angular) - math.sin(lat_rad) * math.sin(dest_lat),
+    )
+    return math.degrees(dest_lat), math.degrees(dest_lng)
+
+
+@pytest.mark.parametrize("lat", [0.0, 37.42, -33.87, 60.17, 70.0])
+@pytest.mark.parametrize("bearing", [0, 45, 90, 135, 180, 270])
+def test_fast_distance_within_tolerance_at_max_radius(monkeypatch, lat, bearing):
+    """Equirectangular approximation stays within 0.3% of haversine at 50 km"""
+    point = offset_point(lat, -122.08, 50000, bearing)
+
+    monkeypatch.setattr(utils, "_FAST_HAVERSINE", False)
+    exact = calculate_distance(lat, -122.08, *point)
+
+    monkeypatch.setattr(utils, "_FAST_HAVERSINE", True)
+    fast = calculate_distance(lat, -122.08, *point)
+
+    assert exact == pytest.approx(50000, rel=1e-6)
+    assert fast == pytest.approx(exact, rel=0.003)
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_calculate_distances_matches_scalar(monkeypatch, fast):
+    """Batch distances match calculate_distance for each point"""
+    monkeypatch.setattr(utils, "_FAST_HAVERSINE", fast)
+    points = [offset_point(37.42, -122.08, 1000 * i, 40 * i) for i in range(1, 8)]
+
+    assert calculate_distances(37.42, -122.08, points) == [
+        calculate_distance(37.42, -122.08, point_lat, point_lng) for point_lat, point_lng in points
+    ]
+
+
+def test_canonicalize_address_ignores_case_and_punctuation():
+    """Addresses differing only in case, punctuation or spacing share a key"""
+    assert canonicalize_address("123 Main St., Springfield,  IL") == "123 main st springfield il"
+    assert canonicalize_address("123 main st springfield il") == "123 main st springfield il"